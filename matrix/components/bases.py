@@ -5,7 +5,7 @@ from decimal import Decimal
 from numbers import Real
 from operator import add, mul, truediv, sub
 
-from .elements import Element
+from .elements import Element, tolerance
 from .. import utils  # Only meant to be used for `ROUND_LIMIT`
 from ..exceptions import BrokenMatrixView
 from ..utils import (
@@ -345,6 +345,6 @@ class RowColumn(metaclass=ABCMeta):
 
 
 def _rounded(row_col: list) -> list:
-    limit = Element(f"1e-{utils.ROUND_LIMIT}")
+    limit = tolerance(utils.ROUND_LIMIT)
 
     return [Element(round(x)) if 0 < abs(x - round(x)) < limit else x for x in row_col]
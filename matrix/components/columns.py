@@ -180,7 +180,8 @@ class Column(RowColumn):
     def __str__(self):
         self.__validity_check()
 
-        return f"Column({[row[self.__index] for row in self.__matrix._array]})"
+        index = self.__index
+        return f"Column({[row[index] for row in self.__matrix._array]})"
 
     def __getitem__(self, sub):
         self.__validity_check()
@@ -198,7 +199,8 @@ class Column(RowColumn):
 
         elif isinstance(sub, slice):
             sub = adjust_slice(sub, self.__matrix.nrow)
-            return [row[self.__index] for row in self.__matrix._array[sub]]
+            index = self.__index
+            return [row[index] for row in self.__matrix._array[sub]]
 
         raise TypeError("Subscript must either be an integer or a slice.")
 
@@ -224,8 +226,9 @@ class Column(RowColumn):
         elif isinstance(sub, slice):
             sub = adjust_slice(sub, self.__matrix.nrow)
             value = valid_container(value, slice_length(sub))
+            index = self.__index
             for row, element in zip(self.__matrix._array[sub], value):
-                row[self.__index] = element
+                row[index] = element
 
         else:
             raise TypeError("Subscript must either be an integer or a slice.")
@@ -238,9 +241,8 @@ class Column(RowColumn):
     def __iter__(self):
         self.__validity_check()
 
-        return MatrixIter(
-            (row[self.__index] for row in self.__matrix._array), self.__matrix
-        )
+        index = self.__index
+        return MatrixIter((row[index] for row in self.__matrix._array), self.__matrix)
 
     def __contains__(self, item):
         self.__validity_check()
@@ -248,7 +250,8 @@ class Column(RowColumn):
         if not isinstance(item, (Real, Decimal)):
             raise TypeError("Matrix elements are only real numbers.")
 
-        return any(item == row[self.__index] for row in self.__matrix._array)
+        index = self.__index
+        return any(item == row[index] for row in self.__matrix._array)
 
     def __eq__(self, other):
         self.__validity_check()
@@ -309,4 +312,5 @@ class Column(RowColumn):
     def _fast_iter(self):
         """Meant to be used internally for faster iteration"""
 
-        return iter([row[self.__index] for row in self.__matrix._array])
+        index = self.__index
+        return iter([row[index] for row in self.__matrix._array])
@@ -8,11 +8,11 @@ Implemented and used this type because:
 """
 
 from decimal import Decimal
-from functools import wraps
+from functools import lru_cache, wraps
 
 from .utils import MethodDecoMeta
 
-__all__ = ("Element", "to_Element")
+__all__ = ("Element", "to_Element", "tolerance")
 
 
 def numeric_deco(func):
@@ -93,14 +93,33 @@ def to_Element(value):
     and "weird" results produced by `decimal.Decimal`'s default `float` conversion.
     """
 
+    # Integers (and integer-valued floats) are represented exactly,
+    # hence need no rounding.
+    if isinstance(value, int):
+        return Element(value)
+    if isinstance(value, float):
+        if value.is_integer():
+            return Element(value)
+        value = Element(str(value))
+    elif isinstance(value, str):
+        value = Element(value)
+
     # Importing `..utils` while loading this module will result in circular import
     # since `..utils` imports [this function] from this module.
     from ..utils import ROUND_LIMIT
 
-    limit = Element(f"1e-{ROUND_LIMIT}")
-    if isinstance(value, float) and not value.is_integer():
-        value = Element(str(value))
-    elif isinstance(value, str):
-        value = Element(value)
+    limit = tolerance(ROUND_LIMIT)
 
     return Element(round(value) if 0 < abs(value - round(value)) < limit else value)
+
+
+@lru_cache(maxsize=None)
+def tolerance(ndigits: int):
+    """
+    Returns `1e-ndigits` as an `Element` instance.
+
+    Any number with a magnitude below this value is considered a zero.
+    Cached, to avoid parsing a string into a new `Element` on every operation.
+    """
+
+    return Element(f"1e-{ndigits}")
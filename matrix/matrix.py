@@ -3,9 +3,8 @@
 from decimal import Decimal
 from math import prod
 from numbers import Real
-from operator import add, itemgetter, mul, sub
 
-from .components import Element, to_Element, Rows, Columns
+from .components import Element, to_Element, tolerance, Rows, Columns
 from .exceptions import InvalidDimension, ZeroDeterminant
 from .utils import (
     adjust_slice,
@@ -19,6 +18,9 @@ from . import utils  # Only meant to be used for `ROUND_LIMIT`
 
 __all__ = ("Matrix", "unit_matrix")
 
+# Elements are immutable, hence a single zero can be shared by all matrices.
+_ZERO = Element(0)
+
 
 @mangled_attr(_del=False)
 class Matrix:
@@ -54,7 +56,7 @@ class Matrix:
             rows, cols = rows_array, cols_zfill
 
             if rows > 0 < cols:
-                self.__array = [[Element(0)] * cols for _ in range(rows)]
+                self.__array = [[_ZERO] * cols for _ in range(rows)]
                 self.__nrow, self.__ncol = rows, cols
             else:
                 raise InvalidDimension("Matrix dimensions must be greater than zero.")
@@ -94,9 +96,7 @@ class Matrix:
         rows_strs = [["%.4g" % element for element in row] for row in self.__array]
 
         # Get lengths of longest formatted strings in each column
-        column_widths = [
-            max(map(len, map(itemgetter(i), rows_strs))) for i in range(self.__ncol)
-        ]
+        column_widths = [max(map(len, column)) for column in zip(*rows_strs)]
 
         # Generate the format_spec for each column
         # specifying the width (plus a padding of 2) and center-align
@@ -252,7 +252,9 @@ class Matrix:
             while c < ncol:
                 r_c = yield row[c]
 
-                if nrow != self.__nrow or ncol != self.__ncol:
+                # The underlying lists are checked directly, since `len()` costs
+                # less than two attribute lookups on the matrix for every element.
+                if len(array) != nrow or len(array[r]) != ncol:
                     raise RuntimeError("The matrix was resized during iteration.")
 
                 if r_c is not None:
@@ -294,10 +296,9 @@ class Matrix:
         """Applies the specified rounding to each matrix element."""
         # _ndigits_ is `0` by default to ensure elements remain of type `Element`.
 
-        new = __class__(*self.size)
-        new.__array = [[round(x, ndigits) for x in row] for row in self.__array]
-
-        return new
+        return self.__from_array(
+            [[round(x, ndigits) for x in row] for row in self.__array], *self.size
+        )
 
     def __pos__(self):
         """Returns an unchanged copy of the matrix."""
@@ -307,7 +308,8 @@ class Matrix:
     def __neg__(self):
         """Returns a copy of the matrix with each element negated."""
 
-        return self.copy() * -1
+        # Scalar multiplication already returns a new matrix.
+        return self * -1
 
     def __bool__(self):
         """
@@ -343,10 +345,17 @@ class Matrix:
                 "The matrices must be of equal size for `+`.", matrices=(self, other)
             )
 
-        new = __class__(*self.size)
-        new.__array = [list(map(add, *pair)) for pair in zip(self.__array, other.__array)]
+        # Computed with the plain `Decimal` method, each sum is then converted
+        # only once, instead of through the `Element` method wrapper.
+        add = Decimal.__add__
 
-        return new
+        return self.__from_array(
+            [
+                list(map(Element, map(add, row1, row2)))
+                for row1, row2 in zip(self.__array, other.__array)
+            ],
+            *self.size,
+        )
 
     def __sub__(self, other):
         """
@@ -363,10 +372,16 @@ class Matrix:
                 "The matrices must be of equal size for `-`.", matrices=(self, other)
             )
 
-        new = __class__(*self.size)
-        new.__array = [list(map(sub, *pair)) for pair in zip(self.__array, other.__array)]
+        # See `__add__()`.
+        sub = Decimal.__sub__
 
-        return new
+        return self.__from_array(
+            [
+                list(map(Element, map(sub, row1, row2)))
+                for row1, row2 in zip(self.__array, other.__array)
+            ],
+            *self.size,
+        )
 
     def __mul__(self, other):
         """
@@ -378,13 +393,17 @@ class Matrix:
         if not isinstance(other, (Decimal, Real)):
             return NotImplemented
 
-        new = __class__(*self.size)
-        new.__array = [[element * other for element in row] for row in self.__array]
+        # The scalar is converted once and the products are computed with the
+        # plain `Decimal` method. Each product is rounded (due to floating-point
+        # limitations) as it's computed, instead of in a second pass.
+        other = _scalar(other)
+        limit = tolerance(utils.ROUND_LIMIT)
+        mul = Decimal.__mul__
 
-        # Due to floating-point limitations
-        _round(new)
-
-        return new
+        return self.__from_array(
+            [[_round_element(mul(x, other), limit) for x in row] for row in self.__array],
+            *self.size,
+        )
 
     def __rmul__(self, other):
         """
@@ -405,22 +424,32 @@ class Matrix:
         if not isinstance(other, __class__):
             return NotImplemented
 
-        if not self.is_conformable(self, other):
+        # Same as `is_conformable()`, without the redundant type check.
+        if self.__ncol != other.__nrow:
             raise InvalidDimension(
                 "The matrices are not conformable in the given order",
                 matrices=(self, other),
             )
 
-        new = __class__(self.__nrow, other.__ncol)
+        # The dot products are computed with the plain `Decimal` methods,
+        # bypassing the `Element` wrappers and the creation of an `Element`
+        # for every intermediate product and sum.
+        # Only the final sums are converted, and rounded (due to floating-point
+        # limitations) as they're computed, instead of in a second pass.
+        limit = tolerance(utils.ROUND_LIMIT)
         columns = tuple(zip(*other.__array))
-        new.__array = [
-            [sum(map(mul, row, col)) for col in columns] for row in self.__array
-        ]
-
-        # Due to floating-point limitations
-        _round(new)
 
-        return new
+        return self.__from_array(
+            [
+                [
+                    _round_element(sum(map(Decimal.__mul__, row, col)), limit)
+                    for col in columns
+                ]
+                for row in self.__array
+            ],
+            self.__nrow,
+            other.__ncol,
+        )
 
     def __truediv__(self, other):
         """
@@ -432,13 +461,15 @@ class Matrix:
         if not isinstance(other, (Decimal, Real)):
             return NotImplemented
 
-        new = __class__(*self.size)
-        new.__array = [[element / other for element in row] for row in self.__array]
-
-        # Due to floating-point limitations
-        _round(new)
+        # See `__mul__()`.
+        other = _scalar(other)
+        limit = tolerance(utils.ROUND_LIMIT)
+        div = Decimal.__truediv__
 
-        return new
+        return self.__from_array(
+            [[_round_element(div(x, other), limit) for x in row] for row in self.__array],
+            *self.size,
+        )
 
     def __pow__(self, exp):
         """Repeated matrix multilication"""
@@ -452,12 +483,19 @@ class Matrix:
         if exp == -1:
             return ~self
 
-        new = self.copy()
+        # Exponentiation by squaring i.e O(log(exp)) matrix multiplications.
         # Delibrately didn't use in-place multiplaction or augmented assignment
-        for _ in range(exp - 1):
-            new = new.__matmul__(self)
+        result = None
+        base = self
+        while True:
+            if exp & 1:
+                result = base.copy() if result is None else result.__matmul__(base)
+            exp >>= 1
+            if not exp:
+                break
+            base = base.__matmul__(base)
 
-        return new
+        return result
 
     def __invert__(self):
         """Matrix Inverse"""
@@ -475,9 +513,9 @@ class Matrix:
         except ZeroDeterminant as err:
             # Shows that the zero determinant is the reason for non-invertibility
             raise ValueError("This matrix is non-invertible.") from err
-        inverse = augmented[:, nrow + 1 :]
-
-        return inverse
+        # The right half is taken directly, as the elements need no re-validation
+        # (which subscripting the augmented matrix would do).
+        return self.__from_array([row[nrow:] for row in augmented.__array], nrow, nrow)
 
     def __or__(self, other):
         """Matrix Augmentation"""
@@ -523,6 +561,7 @@ class Matrix:
     def __imatmul__(self, other):
         if (result := self.__matmul__(other)) is not NotImplemented:
             self.__array[:] = result.__array
+            self.__ncol = result.__ncol
             return self
 
         return result
@@ -544,6 +583,7 @@ class Matrix:
     def __ior__(self, other):
         if (result := self.__or__(other)) is not NotImplemented:
             self.__array[:] = result.__array
+            self.__ncol = result.__ncol
             return self
 
         return result
@@ -578,11 +618,14 @@ class Matrix:
             )
 
         matrix = self.copy()
-        reduce(matrix)
+        swaps = reduce(matrix)
 
         det = prod([row[i] for i, row in enumerate(matrix.__array)])
+        if swaps % 2:
+            det = -det
+        limit = tolerance(utils.ROUND_LIMIT)
 
-        return Element(round(det)) if abs(det - round(det)) < Element("1e-12") else det
+        return Element(round(det)) if abs(det - round(det)) < limit else det
 
     @property
     def diagonal(self):
@@ -647,10 +690,10 @@ class Matrix:
         and leaves the original (self) unchanged.
         """
 
-        new = self.copy()
-        new.transpose()
-
-        return new
+        # Built directly, rather than transposing a copy.
+        return self.__from_array(
+            list(map(list, zip(*self.__array))), self.__ncol, self.__nrow
+        )
 
     ### Reduction Operations
 
@@ -697,7 +740,7 @@ class Matrix:
 
         # Any number with a magnitude below 'limit'
         # is considered a zero, due to floating-point limitations
-        limit = Element(f"1e-{utils.ROUND_LIMIT}")
+        limit = tolerance(utils.ROUND_LIMIT)
 
         # Row currenly being used to reduce those above it.
         j = self.__nrow - 1  # Starting from last row.
@@ -715,23 +758,11 @@ class Matrix:
                 # Find next row above with a non-zero element on column k
                 for i in range(j - 1, -1, -1):
                     if abs(array[i][k]) > limit:
-                        if any(array[j][:k]):
-                            # Move row i **below** row j since row i has
-                            # a non-zero element on that same column k.
-                            # There can never exist a row **above** row j
-                            # that has a non-zero element **after** column k.
-                            # Note that every row below i (including row j)
-                            # would've moved up an index after popping row i.
-                            array.insert(j, array.pop(i))
-                        else:  # row j is a zero row
-                            array.insert(0, array.pop(j))  # move to the top
-                            # ensure the row now at j is the row previously
-                            # found at i
-                            if abs(array[j][k]) < limit:
-                                # `+1` cos moving the zero-row to the top
-                                # shifts the rows that were previously above it
-                                # down one index
-                                array.insert(j, array.pop(i + 1))
+                        # Swap rows i and j.
+                        # The rows between them also have zeros on column k.
+                        # If row j is a zero row, it keeps getting swapped
+                        # upwards until it's above all non-zero rows.
+                        array[i], array[j] = array[j], array[i]
                         break
                 else:  # All elements **above** (j,k) are zeros
                     # Move on to previous column, still on the same row j
@@ -745,7 +776,7 @@ class Matrix:
                 # Also prevents having `-0` elements
                 if abs(array[i][k]) > limit:
                     mult = array[i][k] / array[j][k]
-                    array[i] = [x - y * mult for x, y in zip(array[i], array[j])]
+                    array[i] = _row_operation(array[i], array[j], mult)
             j -= 1
             k -= 1
 
@@ -768,7 +799,7 @@ class Matrix:
             # Avoids division by zero and redundant division by 1
             if (k := rows[j + 1].pivot_index) and (pivot := row[k - 1]) != 1:
                 # Prevents having `-0` as elements.
-                array[j] = [x / pivot if x else Element(0) for x in row]
+                array[j] = [x / pivot if x else _ZERO for x in row]
 
             # Reduce elements above pivots to zeros.
             for i in range(j - 1, -1, -1):
@@ -776,8 +807,9 @@ class Matrix:
                 # No need to divide array[i][k] by the pivot for the
                 # multiplier since all pivots are already 1s.
                 # Row operation is redundant if array[i][k] is zero.
+                # Elements of row j before its pivot are all zeros.
                 if mult := array[i][k - 1]:
-                    array[i] = [x - y * mult for x, y in zip(array[i], array[j])]
+                    array[i] = _row_operation(array[i], array[j], mult, k - 1)
 
     def forward_eliminate(self):
         """
@@ -827,7 +859,7 @@ class Matrix:
             # Avoids redundant division by 1.
             if (d_i := row[i]) != 1:
                 # Prevents having `-0` as elements.
-                array[i] = [x / d_i if x else Element(0) for x in row]
+                array[i] = [x / d_i if x else _ZERO for x in row]
 
         # Due to floating-point limitations
         _round(self)
@@ -837,7 +869,10 @@ class Matrix:
     def round(self, ndigits=None):
         """Rounds the matrix elements in-place"""
 
-        self.__array[:] = [[round(x, ndigits) for x in row] for row in self.__array]
+        # `Element()` since `round()` returns an `int` when _ndigits_ is `None`.
+        self.__array[:] = [
+            [Element(round(x, ndigits)) for x in row] for row in self.__array
+        ]
 
     @staticmethod
     def compare_rounded(mat1, mat2, ndigits=None):
@@ -852,7 +887,7 @@ class Matrix:
             difference is irrelevant. Defaults to `ROUND_LIMIT` if not given.
         """
 
-        limit = Element(f"1e-{utils.ROUND_LIMIT}" if ndigits is None else f"1e-{ndigits}")
+        limit = tolerance(utils.ROUND_LIMIT if ndigits is None else ndigits)
 
         return all(
             all(abs(x - y) < limit for x, y in zip(row1, row2))
@@ -863,10 +898,7 @@ class Matrix:
         """Creates and returns a new copy of a matrix."""
 
         # Much faster than passing the array to Matrix().
-        new = __class__(*self.size)
-        new.__array = [row.copy() for row in self.__array]
-
-        return new
+        return self.__from_array([row.copy() for row in self.__array], *self.size)
 
     def flip_x(self):
         """Flips the columns of the matrix in-place (i.e horizontally)."""
@@ -893,87 +925,96 @@ class Matrix:
         NOTE: this argument is meant for internal use only.
         """
 
-        if not all(isinstance(x, (type(None), int)) for x in (nrow, ncol)):
-            # At least one value given for new dimnsion is of a wrong type.
-            raise TypeError("Any specified dimension must be an integer.")
-
-        if any(None is not x < 1 for x in (nrow, ncol)):
-            # At least one of the new dimensions given is less than 1.
-            raise ValueError("Any specified dimension must be greater than zero.")
-
-        # Number of rows
-        if nrow:  # 'nrow' can only be either None or a +ve integer at this point.
-            diff = nrow - self.__nrow
-            if diff > 0:
-                self.__array.extend([[Element(0)] * self.__ncol] * diff)
-            elif diff < 0:
-                del self.__array[diff:]
+        for x in (nrow, ncol):
+            if x is None:
+                continue
+            if not isinstance(x, int):
+                # A value given for new dimnsion is of a wrong type.
+                raise TypeError("Any specified dimension must be an integer.")
+            if x < 1:
+                # A new dimension given is less than 1.
+                raise ValueError("Any specified dimension must be greater than zero.")
+
+        # Excess rows are removed before the columns are resized and new rows are
+        # added after, so that no column work is done on rows being removed and
+        # new rows are created with the final number of columns.
+
+        # 'nrow' and 'ncol' can only be either None or +ve integers at this point.
+
+        # Number of rows (truncation)
+        if nrow and nrow < self.__nrow:
+            del self.__array[nrow:]
             self.__nrow = nrow
 
         # Number of columns
-        if ncol:  # 'ncol' can only be either None or a +ve integer at this point.
+        if ncol:
             if pad_rows:
                 if any(len(row) > ncol for row in self.__array):
                     raise ValueError(
                         "Specified number of columns is"
                         " less than length of longest row."
                     )
+                # A single zero buffer from which each row is padded.
+                # Rows already of full length are left untouched.
+                zeros = [_ZERO] * ncol
                 for row in self.__array:
-                    row.extend([Element(0)] * (ncol - len(row)))
-                self.__ncol = ncol
-                return
-
-            diff = ncol - self.__ncol
-            if diff > 0:
-                for row in self.__array:
-                    row.extend([Element(0)] * diff)
-            elif diff < 0:
-                for row in self.__array:
-                    del row[diff:]
+                    if len(row) < ncol:
+                        row.extend(zeros[len(row) :])
+            else:
+                diff = ncol - self.__ncol
+                if diff > 0:
+                    zeros = [_ZERO] * diff
+                    for row in self.__array:
+                        row.extend(zeros)
+                elif diff < 0:
+                    for row in self.__array:
+                        del row[ncol:]
             self.__ncol = ncol
         elif pad_rows:
             raise ValueError("Number of columns not specified for padding.")
 
+        # Number of rows (zero-fill)
+        if nrow and nrow > self.__nrow:
+            # Each new row must be a distinct list object.
+            zeros = [_ZERO] * self.__ncol
+            self.__array.extend([zeros.copy() for _ in range(nrow - self.__nrow)])
+            self.__nrow = nrow
+
     def rotate_left(self):
         """Rotate the matrix 90 degrees anti-clockwise."""
 
-        self.transpose()
-        self.flip_y()
+        # Transpose and vertical flip in a single pass
+        # i.e the last column becomes the first row.
+        self.__array[:] = map(list, zip(*map(reversed, self.__array)))
+        self.__ncol, self.__nrow = self.size
 
     def rotate_right(self):
         """Rotate the matrix 90 degrees clockwise."""
 
-        self.transpose()
-        self.flip_x()
+        # Transpose and horizontal flip in a single pass
+        # i.e the first column (bottom-up) becomes the first row.
+        self.__array[:] = map(list, zip(*reversed(self.__array)))
+        self.__ncol, self.__nrow = self.size
 
     ## Matrix Properties
 
     def is_diagonal(self):
         """Returns `True` if the matrix is diagonal and `False` otherwise."""
 
-        # `-1` here to avoid `n-1` in the loop condition, two while loops below.
-        array, n = self.__array, self.__nrow - 1
+        array = self.__array
 
-        if n + 1 != self.__ncol:
+        if self.__nrow != self.__ncol:
             return False  # matrix is not sqaure
 
         # No zero on principal diagonal
-        i = 0
-        while i <= n:
-            if not array[i][i]:
-                return False
-            i += 1
+        if not all([row[i] for i, row in enumerate(array)]):
+            return False
 
         # All elements off the principal diagonal must be zeros.
-        i = 0
-        while i < n:
-            j = i + 1
-            while j <= n:
-                # Testing diagonally-opposite squares together.
-                if array[i][j] or array[j][i]:
-                    return False
-                j += 1
-            i += 1
+        # `any()` over slices keeps the per-element work at C level.
+        for i, row in enumerate(array):
+            if any(row[:i]) or any(row[i + 1 :]):
+                return False
 
         return True
 
@@ -985,7 +1026,24 @@ class Matrix:
     def is_orthogonal(self):
         """Returns `True` if the matrix is orthogonal and `False` otherwise."""
 
-        return (self @ self.transposed()).is_unit()
+        # Equivalent to testing if `self @ self.transposed()` is a unit matrix
+        # but without building either matrix.
+        # Element (i, j) of the product is the dot product of rows i and j,
+        # hence the product is symmetric and only its upper triangle is checked.
+
+        # Any number with a magnitude below 'limit'
+        # is considered a zero, due to floating-point limitations
+        limit = tolerance(utils.ROUND_LIMIT)
+
+        array = self.__array
+        for i, row_i in enumerate(array):
+            if abs(sum(map(Decimal.__mul__, row_i, row_i)) - 1) >= limit:
+                return False
+            for row_j in array[i + 1 :]:
+                if abs(sum(map(Decimal.__mul__, row_i, row_j))) >= limit:
+                    return False
+
+        return True
 
     def is_square(self):
         """Returns `True` if the matrix is square and `False` otherwise."""
@@ -995,88 +1053,85 @@ class Matrix:
     def is_symmetric(self):
         """Returns `True` if the matrix is symmetric and `False` otherwise."""
 
-        # `-1` here to avoid `n-1` in the loop condition below.
-        array, n = self.__array, self.__nrow - 1
+        array = self.__array
 
-        if n + 1 != self.__ncol:
+        if self.__nrow != self.__ncol:
             return False  # matrix is not sqaure
 
-        i = 0
-        while i < n:
-            j = i + 1
-            while j <= n:
-                if array[i][j] != array[j][i]:
-                    return False
-                j += 1
-            i += 1
+        # The part of each row after the principal diagonal must equal
+        # the part of the corresponding column below it.
+        # Comparing whole lists keeps the per-element work at C level.
+        for i, row in enumerate(array, 1):
+            if row[i:] != [row_[i - 1] for row_ in array[i:]]:
+                return False
 
         return True
 
     def is_triangular(self):
         """Returns `True` if the matrix is triangular and `False` otherwise."""
 
-        return self.is_upper_triangular() or self.is_upper_triangular()
+        if self.__nrow != self.__ncol:
+            return False  # matrix is not sqaure
+
+        # Both triangles are checked in a single pass over the rows.
+        # 'upper' -> all elements **below** the principal diagonal are zeros.
+        # 'lower' -> all elements **above** the principal diagonal are zeros.
+        # `any()` over slices keeps the per-element work at C level.
+        upper = lower = True
+        for i, row in enumerate(self.__array):
+            if upper and any(row[:i]):
+                upper = False
+            if lower and any(row[i + 1 :]):
+                lower = False
+            if not (upper or lower):
+                return False
+
+        return True
 
     def is_unit(self):
         """Returns `True` if a unit matrix and `False` otherwise."""
 
-        if not self.is_diagonal():
-            return False
+        if self.__nrow != self.__ncol:
+            return False  # matrix is not sqaure
 
-        array, n = self.__array, self.__nrow
-        i = 0
-        while i < n:
-            if array[i][i] != 1:
-                return False
-            i += 1
+        # The diagonal is checked first since it's much cheaper than the
+        # off-diagonal scan done by `is_diagonal()`, which then only runs
+        # for matrices with all ones on the principal diagonal.
+        if not all([row[i] == 1 for i, row in enumerate(self.__array)]):
+            return False
 
-        return True
+        return self.is_diagonal()
 
     def is_skew_symmetric(self):
         """Returns `True` if the matrix is skew-symmetric and `False` otherwise."""
 
-        # `-1` here to avoid `n-1` in the loop condition below.
-        array, n = self.__array, self.__nrow - 1
+        array = self.__array
 
-        if n + 1 != self.__ncol:
+        if self.__nrow != self.__ncol:
             return False  # matrix is not sqaure
 
-        # All zeros on principal diagonal
-        i = 0
-        while i <= n:
-            if array[i][i]:
+        # In a single pass, each row must have a zero on the principal diagonal
+        # and the part after it must equal the negation of the part of the
+        # corresponding column below the diagonal.
+        # The plain `Decimal` method is used since the negations are only compared.
+        neg = Decimal.__neg__
+        for i, row in enumerate(array, 1):
+            if row[i - 1] or row[i:] != [neg(row_[i - 1]) for row_ in array[i:]]:
                 return False
-            i += 1
-
-        i = 0
-        while i < n:
-            j = i + 1
-            while j <= n:
-                if array[i][j] != -array[j][i]:
-                    return False
-                j += 1
-            i += 1
 
         return True
 
     def is_lower_triangular(self):
         """Returns `True` if the matrix is lower triangular and `False` otherwise."""
 
-        # `-1` here to avoid `n-1` in the loop condition below.
-        array, n = self.__array, self.__nrow - 1
-
-        if n + 1 != self.__ncol:
+        if self.__nrow != self.__ncol:
             return False  # matrix is not sqaure
 
         # All elements **above** the principal diagonal must be zeros.
-        i = 0
-        while i < n:
-            j = i + 1
-            while j <= n:
-                if array[i][j]:
-                    return False
-                j += 1
-            i += 1
+        # `any()` over slices keeps the per-element work at C level.
+        for i, row in enumerate(self.__array, 1):
+            if any(row[i:]):
+                return False
 
         return True
 
@@ -1091,23 +1146,14 @@ class Matrix:
             Meant for internal use (in Back substitution method).
         """
 
-        array = self.__array
-
-        # `-1` here is to avoid `n-1` in the loop condition below.
-        n = self.__nrow - 1
-
         # By definition, only square matrices can be considered triangular
         # but for the sake of augmented matrices.
-        if n + 1 == self.__ncol or (as_square and self.__ncol > self.__nrow):
+        if self.__nrow == self.__ncol or (as_square and self.__ncol > self.__nrow):
             # All elements **below** the principal diagonal must be zeros.
-            j = 0
-            while j < n:
-                i = j + 1
-                while i <= n:
-                    if array[i][j]:
-                        return False
-                    i += 1
-                j += 1
+            # `any()` over slices keeps the per-element work at C level.
+            for i, row in enumerate(self.__array):
+                if any(row[:i]):
+                    return False
 
             return True
 
@@ -1120,11 +1166,32 @@ class Matrix:
         otherwise `False`.
         """
 
-        if not isinstance(lhs, __class__):
+        if not (isinstance(lhs, __class__) and isinstance(rhs, __class__)):
             raise TypeError("Only matrices can be tested for conformability.")
 
         return lhs.__ncol == rhs.__nrow
 
+    # Internal-use only
+
+    @staticmethod
+    def __from_array(array, nrow, ncol):
+        """
+        Creates a new matrix using _array_ (of dimension _nrow_ x _ncol_)
+        as its underlying array.
+
+        _array_ must be a list of lists of `Element`s, as it's neither validated
+        nor copied. This avoids allocating a null matrix whose array would
+        be immediately replaced.
+        """
+
+        new = __class__.__new__(__class__)
+        new.__array = array
+        new.__nrow, new.__ncol = nrow, ncol
+        new.__rows = Rows(new)
+        new.__columns = Columns(new)
+
+        return new
+
 
 # Register classes that access Matrix attributes with mangled names.
 Matrix._register(Rows, Columns)
@@ -1154,9 +1221,9 @@ def unit_matrix(n: int):
         raise InvalidDimension("Matrix dimension must be greater than zero.")
 
     new = Matrix(n, n)
-    array = new._array
-    for i in range(n):
-        array[i][i] = 1
+    one = Element(1)
+    for i, row in enumerate(new._array):
+        row[i] = one
 
     return new
 
@@ -1178,14 +1245,69 @@ def _round(matrix, ndigits=None):
 
     # Did not hard-code this to `ROUND_LIMIT`
     # in case it needs to be used differently.
-    limit = Element(f"1e-{utils.ROUND_LIMIT if ndigits is None else ndigits}")
+    limit = tolerance(utils.ROUND_LIMIT if ndigits is None else ndigits)
     array = matrix._array
+    # The plain `Decimal` methods bypass the `Element` wrappers.
+    round_, sub = Decimal.__round__, Decimal.__sub__
     array[:] = [
-        [Element(round(x)) if 0 < abs(x - round(x)) < limit else x for x in row]
+        [Element(r) if 0 < abs(sub(x, r := round_(x))) < limit else x for x in row]
         for row in array
     ]
 
 
+def _round_element(x, limit):
+    """
+    Returns _x_ as an `Element`, rounded to the nearest integer
+    if it differs from it by a magnitude below _limit_.
+
+    _x_ must be a `Decimal` (or `Element`) instance. The plain `Decimal` methods
+    are used, bypassing the `Element` wrappers.
+
+    NOTE: Meant for internal use only.
+    """
+
+    r = Decimal.__round__(x)
+
+    return Element(r if 0 < abs(Decimal.__sub__(x, r)) < limit else x)
+
+
+def _scalar(value):
+    """
+    Converts a scalar operand to an `Element`, the same way `numeric_deco()` does.
+
+    Unlike `to_Element()`, the value is never rounded to an integer,
+    since that is only meant for the results of operations.
+
+    NOTE: Meant for internal use only.
+    """
+
+    if isinstance(value, float) and not value.is_integer():
+        return Element(str(value))
+
+    return Element(value)
+
+
+def _row_operation(row1, row2, mult, start=0):
+    """
+    Returns the result of the row operation `row1 - row2 * mult`, as a new row.
+
+    The arithmetic is performed with the plain `Decimal` methods, bypassing the
+    `Element` wrappers and the creation of an `Element` for every intermediate
+    result. Only the final elements are converted.
+
+    Elements of _row1_ before index _start_ are taken as-is,
+    for when those of _row2_ are known to be zeros.
+
+    NOTE: Meant for internal use only.
+    """
+
+    sub, mul = Decimal.__sub__, Decimal.__mul__
+
+    return row1[:start] + [
+        Element(sub(x, mul(y, mult))) for x, y in zip(row1[start:], row2[start:])
+    ]
+
+
 def reduce(matrix, as_square=False):
     """
     Performs row reduction operations on a matrix.
@@ -1196,6 +1318,8 @@ def reduce(matrix, as_square=False):
         on a non-square matrix as if it were a square matrix of the smaller
         dimension, though row operations still affect the entire row.
         Useful in cases of augmented matrices, for example.
+
+    Returns: the number of row interchanges performed.
     """
 
     array = matrix._array
@@ -1211,7 +1335,7 @@ def reduce(matrix, as_square=False):
 
     # Any number with a magnitude below 'limit'
     # is considered a zero, due to floating-point limitations
-    limit = Element(f"1e-{utils.ROUND_LIMIT}")
+    limit = tolerance(utils.ROUND_LIMIT)
 
     # Row currenly being used to reduce those below it.
     j = 0  # Starting from the first row.
@@ -1220,6 +1344,9 @@ def reduce(matrix, as_square=False):
     # and of elements being reduced to zero at that step
     k = 0
 
+    # Each row interchange negates the determinant.
+    swaps = 0
+
     # The pivot element [being used to reduce those below it to zeros]
     # can be on the last column but not on the last row since there's
     # nothing below the last row.
@@ -1228,19 +1355,12 @@ def reduce(matrix, as_square=False):
             # Find next row below with a non-zero element on column k
             for i in range(j + 1, nrow):
                 if abs(array[i][k]) > limit:
-                    if any(array[j][k + 1 :]):
-                        # Move row i **above** row j since row i has
-                        # a non-zero element on that same column k.
-                        # There can never exist a row **below** row j
-                        # that has a non-zero element **before** column k.
-                        array.insert(j, array.pop(i))
-                    else:  # row j is a zero row
-                        array.insert(nrow, array.pop(j))  # move to the bottom
-                        # ensure the row now at j is the row previously found at i
-                        if abs(array[j][k]) < limit:
-                            # `-1` cos moving the zero-row to the bottom shifts the
-                            # rows that were previously below it up one index
-                            array.insert(j, array.pop(i - 1))
+                    # Swap rows i and j.
+                    # The rows between them also have zeros on column k.
+                    # If row j is a zero row, it keeps getting swapped
+                    # downwards until it's below all non-zero rows.
+                    array[i], array[j] = array[j], array[i]
+                    swaps += 1
                     break
             else:  # All elements **below** (j,k) are zeros
                 # Move on to next column, still on the same row j
@@ -1254,8 +1374,11 @@ def reduce(matrix, as_square=False):
             # Also prevents having `-0` elements
             if abs(array[i][k]) > limit:
                 mult = array[i][k] / array[j][k]
-                array[i] = [x - y * mult for x, y in zip(array[i], array[j])]
+                # Elements of row j before column k are all zeros.
+                array[i] = _row_operation(array[i], array[j], mult, k)
         j += 1
         k += 1
 
     _round(matrix)
+
+    return swaps
@@ -1,8 +1,9 @@
 """Definitions of utility classes and functions for the main classes."""
 
+from collections.abc import Sized
 from decimal import Decimal
-from functools import wraps
-from math import ceil
+from functools import lru_cache, wraps
+from itertools import chain
 from numbers import Real
 
 from .components import to_Element
@@ -13,10 +14,11 @@ def display_slice(s: slice):
     """Returns a colon-separated string representation of a slice."""
 
     # `or` can't be used in case the attribute is 0.
-    return "{}:{}{}".format(
-        *(x if x is not None else "" for x in (s.start, s.stop)),
-        f":{s.step}" if s.step is not None else "",
-    )
+    start = "" if s.start is None else s.start
+    stop = "" if s.stop is None else s.stop
+    step = "" if s.step is None else f":{s.step}"
+
+    return f"{start}:{stop}{step}"
 
 
 def display_adj_slice(s: slice):
@@ -41,33 +43,55 @@ def adjust_slice(s: slice, length: int) -> slice:
         - `ValueError`, if any index or 'step' is less than 1 or 'start' is out of range.
     """
 
-    if any(None is not x < 1 for x in (s.start, s.stop, s.step)):
+    start, stop, step = s.start, s.stop, s.step
+
+    # The full slice (`:`) is the most common and needs no validation.
+    if start is None and stop is None and step is None:
+        return slice(0, length, 1)
+
+    # The attributes are passed since slices are unhashable (before Python 3.12).
+    return _adjust_slice(start, stop, step, length)
+
+
+# Cached, since the same few slices (e.g whole rows/columns) are adjusted repeatedly.
+# `typed` prevents e.g `slice(1.0, 2)` from being taken as `slice(1, 2)`.
+@lru_cache(maxsize=1024, typed=True)
+def _adjust_slice(start, stop, step, length):
+    """See `adjust_slice()`."""
+
+    s = slice(start, stop, step)
+
+    if None is not start < 1 or None is not stop < 1 or None is not step < 1:
         raise ValueError(
             "%r -> 'start', 'stop' or 'step' is less than 1." % display_slice(s)
         )
-    if s.stop is None:  # 'stop' is not given...
+    if stop is None:  # 'stop' is not given...
         # Can't combine these two conditions,
         # so as not to affect the logic of the `elif` below.
-        if None is not s.start > length:  # ...but 'start' is given and > `length`
+        if None is not start > length:  # ...but 'start' is given and > `length`
             raise ValueError(
                 "%r -> 'start' of slice is out of range (max: %d)."
                 % (display_slice(s), length)
             )
-    elif None is not s.start > s.stop:
+    elif None is not start > stop:
         # 'stop' is given and ('start' is given and > 'stop')
         raise ValueError("'start' > 'stop' in slice %r." % display_slice(s))
 
-    s = s.indices(length)
+    start, stop, step = s.indices(length)
 
     # Leaves the 'stop' attribute unchanged,
     # since matrixes include the (1-indexed) 'stop' index for slicing operations.
-    return slice(max(0, s[0] - 1), *s[1:])
+    return slice(max(0, start - 1), stop, step)
 
 
 def slice_length(s: slice):
     """Returns the number of items selected by an **adjusted** slice."""
 
-    return ceil((s.stop - s.start) / s.step)
+    # Integer ceiling division, avoiding the float path.
+    # Adjusted slices always have a positive 'step'.
+    start, stop, step = s.start, s.stop, s.step
+
+    return (stop - start + step - 1) // step
 
 
 def slice_index(s: slice, index: int):
@@ -91,8 +115,11 @@ def original_slice(s1: slice, s2: slice):
     Returns: the equivalent of _s2_ for the original sequence sliced by _s1_.
     """
 
+    # `slice_index()` inlined.
+    start, step = s1.start, s1.step
+
     return slice(
-        slice_index(s1, s2.start), slice_index(s1, s2.stop - 1) + 1, s1.step * s2.step
+        start + s2.start * step, start + (s2.stop - 1) * step + 1, step * s2.step
     )
 
 
@@ -113,14 +140,17 @@ def valid_2D_iterable(iterable):
     """
 
     try:
-        array = [[element for element in row] for row in iterable]
+        array = [list(row) for row in iterable]
     except TypeError:
         raise TypeError("The array must be an iterable of iterables.") from None
 
     if array:
-        if not all((isinstance(x, (Decimal, Real)) for row in array for x in row)):
+        # Only the distinct element types are checked, since `isinstance()` against
+        # the `Real` ABC is costly when done for every single element.
+        types = set(map(type, chain.from_iterable(array)))
+        if not all(issubclass(type_, (Decimal, Real)) for type_ in types):
             raise TypeError("The inner iterables must contain real numbers only.")
-        lengths = [len(row) for row in array]
+        lengths = list(map(len, array))
     else:
         raise ValueError("The given iterable is empty.")
 
@@ -128,7 +158,7 @@ def valid_2D_iterable(iterable):
         min(lengths),
         max(lengths),
         len(array),
-        [[to_Element(x) for x in row] for row in array],
+        [list(map(to_Element, row)) for row in array],
     )
 
 
@@ -144,14 +174,19 @@ def valid_container(iterable, length=None):
         - `ValueError`, if the length of _iterable_ is not equal to _length_ (if specified).
     """
 
-    # Allow the TypeError to be propagated if 'iterable' is not iterable.
-    container = tuple(iterable)
-    if not all((isinstance(x, (Decimal, Real)) for x in container)):
+    if isinstance(iterable, Sized):
+        # Containers of known length are checked in place, without a copy.
+        container = iterable
+    else:
+        # Allow the TypeError to be propagated if 'iterable' is not iterable.
+        container = tuple(iterable)
+    # See `valid_2D_iterable()`.
+    if not all(issubclass(type_, (Decimal, Real)) for type_ in set(map(type, container))):
         raise TypeError("The object must be an iterable of real numbers.")
     if None is not length != len(container):
         raise ValueError("The iterable is not of an appropriate length.")
 
-    return [to_Element(x) for x in container]
+    return list(map(to_Element, container))
 
 
 def is_iterable(obj):
@@ -194,7 +229,7 @@ def mangled_attr(*, _get=True, _set=True, _del=True):
 
     def deco(cls):
         """
-        Decorates and overrides the getter, setter and/or deletter of _cls_ and adds two extra attributes to the class (provided at least one of the methods is overriden):
+        Adds a fallback getter (`__getattr__`) to and/or overrides the setter and/or deletter of _cls_, and adds two extra attributes to the class (provided at least one of the methods is overriden):
           - '_register' -> A class method used to register other classes that access the mangled attributes.
           - '_registered' -> A set containing (modified) names of registered classes.
 
@@ -203,12 +238,52 @@ def mangled_attr(*, _get=True, _set=True, _del=True):
         Returns: The argument.
         """
 
+        def retry_mangled_get(getattr_):
+            """
+            Creates a `__getattr__` for _cls_ to retry for mangled names after "re-mangling" the attribute name with the name of _cls_.
+
+            Unlike overriding `__getattribute__`, this is only called after the normal lookup has failed, hence the normal lookup costs nothing extra.
+            _getattr_ is the `__getattr__` _cls_ inherits (if any), which is tried first.
+            """
+
+            # Leading underscores of the class name is stripped in mangled names.
+            prefix = "_%s__" % cls.__name__.lstrip("_")
+            getattribute = cls.__getattribute__
+
+            def __getattr__(self, name):
+                if getattr_:
+                    try:
+                        return getattr_(self, name)
+                    except AttributeError as err:
+                        # Only errors about this same attribute are swallowed.
+                        # 'name' is not set on errors before Python 3.10.
+                        if getattr(err, "name", name) != name:
+                            raise
+
+                other_cls, _, name_ = name.partition("__")
+                if name_ and other_cls in cls._registered:
+                    try:
+                        return getattribute(self, prefix + name_)
+                    except AttributeError:
+                        pass
+
+                # Python discards the original error (e.g one raised within a property
+                # body) before calling `__getattr__()`, so the normal lookup is re-run
+                # to raise it again.
+                return getattribute(self, name)
+
+            __getattr__.__qualname__ = cls.__qualname__ + ".__getattr__"
+            __getattr__.__module__ = cls.__module__
+
+            return __getattr__
+
         def retry_mangled(get_set_del):
             """
             Decorates the getter, setter or deleter of _cls_ to retry for mangled names after "re-mangling" the attribute name with the name of _cls_.
             """
 
-            cls_name = cls.__name__
+            # Leading underscores of the class name is stripped in mangled names.
+            prefix = "_%s__" % cls.__name__.lstrip("_")
 
             @wraps(get_set_del)
             def wrapper(self, name, *args):
@@ -219,7 +294,7 @@ def mangled_attr(*, _get=True, _set=True, _del=True):
                     other_cls, _, name = name.partition("__")
                     if name and other_cls in cls._registered:
                         try:
-                            return get_set_del(self, "_%s__%s" % (cls_name, name), *args)
+                            return get_set_del(self, prefix + name, *args)
                         except AttributeError:
                             raise err from None
                     raise
@@ -227,7 +302,7 @@ def mangled_attr(*, _get=True, _set=True, _del=True):
             return wrapper
 
         if _get:
-            cls.__getattribute__ = retry_mangled(cls.__getattribute__)
+            cls.__getattr__ = retry_mangled_get(getattr(cls, "__getattr__", None))
         if _set:
             cls.__setattr__ = retry_mangled(cls.__setattr__)
         if _del:
@@ -290,26 +365,33 @@ class MatrixIter:
     """
 
     # mainly to disable abitrary atributes.
-    __slots__ = ("__iter", "__matrix", "__size")
+    __slots__ = ("__next", "__array", "__nrow", "__ncol")
 
     def __init__(self, iterator, matrix):
-        self.__iter = iter(iterator)  # iter() to ensure an iterator is stored.
-        self.__matrix = matrix
+        # iter() to ensure an iterator is used.
+        # The bound method is stored to avoid looking it up on every iteration.
+        self.__next = iter(iterator).__next__
 
         # for comparison of sizes during iteration,
         # to ensure the matrix hasn't been resized.
-        self.__size = matrix.size
+        # The underlying array is checked directly, since `len()` costs less
+        # than computing the `size` property of the matrix on every iteration.
+        # The outer list never changes in a matrix's lifetime and all rows
+        # have the same length, hence the first row represents the rest.
+        self.__array = matrix._array
+        self.__nrow, self.__ncol = matrix.size
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        if self.__size != self.__matrix.size:
+        array = self.__array
+        if len(array) != self.__nrow or len(array[0]) != self.__ncol:
             raise BrokenMatrixView(
                 "The matrix was resized during iteration.", view_obj=self
             )
 
-        return next(self.__iter)  # StopIteration is also propagated.
+        return self.__next()  # StopIteration is also propagated.
 
 
 # The number of decimal places after which figures are considered insignificant.
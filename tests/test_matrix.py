@@ -1,5 +1,7 @@
 #! /usr/bin/env pytest
 
+from itertools import chain
+import operator
 from random import randint
 import pytest
 
@@ -139,11 +141,16 @@ class TestObjectInteractions:
             assert isinstance(elem, Element)
         # All elements
         assert len((*m,)) == m.nrow * m.ncol
-        assert [*m] == sum(m._array, start=[])
+        assert [*m] == list(chain.from_iterable(m._array))
         # Resize during iteration
         m_iter = iter(m)
         next(m_iter)
         m.resize(ncol=3)
+        with pytest.raises(RuntimeError, match=".* resized .*"):
+            next(m_iter)
+        m_iter = iter(m)
+        next(m_iter)
+        m @= Matrix(3, 2)
         with pytest.raises(RuntimeError, match=".* resized .*"):
             next(m_iter)
 
@@ -203,6 +210,52 @@ class TestObjectInteractions:
             x == -y for r1, r2 in zip(m._array, (-m)._array) for x, y in zip(r1, r2)
         )
 
+    def test_resize(self):
+        m = Matrix(2, 2)
+        m.resize(4, 4)
+        assert m.size == (4, 4) and m.is_null()
+        # New rows must not share the same list object
+        m[4, 4] = 1
+        assert m[3, 4] == 0
+        m.resize(1, 1)
+        assert m._array == [[0]]
+        m = Matrix([[1, 2], [3, 4]])
+        m.resize(3, 3)
+        assert m._array == [[1, 2, 0], [3, 4, 0], [0, 0, 0]]
+        m.resize(1, 2)
+        assert m._array == [[1, 2]]
+        m.resize(2, 1)
+        assert m.size == (2, 1) and m._array == [[1], [0]]
+        # Row padding
+        m = Matrix([[1], [1, 2, 3], []], True)
+        assert m._array == [[1, 0, 0], [1, 2, 3], [0, 0, 0]]
+        # Wrong arguments
+        for args in ((2.0,), (None, "2"), (2, 2.0)):
+            with pytest.raises(TypeError):
+                m.resize(*args)
+        for args in ((0,), (None, -1), (2, 0)):
+            with pytest.raises(ValueError):
+                m.resize(*args)
+
+    def test_flip(self):
+        m = Matrix([[1, 2, 3], [4, 5, 6]])
+        array = m._array
+        m.flip_x()
+        assert m._array == [[3, 2, 1], [6, 5, 4]]
+        m.flip_y()
+        assert m._array == [[6, 5, 4], [3, 2, 1]]
+        assert m._array is array
+
+    def test_rotate(self):
+        m = Matrix([[1, 2, 3], [4, 5, 6]])
+        m.rotate_left()
+        assert m.size == (3, 2)
+        assert m._array == [[3, 6], [2, 5], [1, 4]]
+        m.rotate_right()
+        assert m._array == [[1, 2, 3], [4, 5, 6]]
+        m.rotate_right()
+        assert m._array == [[4, 1], [5, 2], [6, 3]]
+
     def test_bool(self):
         assert not bool(Matrix(1, 1))
         for _ in range(50):
@@ -211,3 +264,218 @@ class TestObjectInteractions:
             m = Matrix(randint(1, 1001), randint(1, 1001))
             m[1, 1] = 1
             assert m
+
+
+class TestProperties:
+    def test_is_triangular(self):
+        upper = Matrix([[1, 2, 3], [0, 5, 6], [0, 0, 9]])
+        lower = Matrix([[1, 0, 0], [4, 5, 0], [7, 8, 9]])
+        assert upper.is_triangular()
+        assert lower.is_triangular()
+        assert Matrix(3, 3).is_triangular()
+        assert not m.is_triangular()
+        assert not Matrix(2, 3).is_triangular()
+
+    def test_is_orthogonal(self):
+        assert unit_matrix(4).is_orthogonal()
+        assert Matrix([[0, 1], [1, 0]]).is_orthogonal()
+        assert Matrix([[0.6, -0.8], [0.8, 0.6]]).is_orthogonal()
+        assert not Matrix([[1, 1], [0, 1]]).is_orthogonal()
+        assert not Matrix([[2, 0], [0, 2]]).is_orthogonal()
+        assert not m.is_orthogonal()
+
+    def test_symmetry(self):
+        sym = Matrix([[1, 2, 3], [2, 5, 6], [3, 6, 9]])
+        skew = Matrix([[0, 2, -3], [-2, 0, 6], [3, -6, 0]])
+        assert sym.is_symmetric() and not sym.is_skew_symmetric()
+        assert skew.is_skew_symmetric() and not skew.is_symmetric()
+        assert Matrix(3, 3).is_symmetric() and Matrix(3, 3).is_skew_symmetric()
+        assert not m.is_symmetric() and not m.is_skew_symmetric()
+        assert not Matrix(2, 3).is_symmetric()
+        assert not Matrix(2, 3).is_skew_symmetric()
+
+    def test_is_diagonal(self):
+        assert unit_matrix(3).is_diagonal()
+        assert Matrix([[2, 0], [0, 3]]).is_diagonal()
+        assert not Matrix([[2, 0], [1, 3]]).is_diagonal()
+        assert not Matrix([[2, 1], [0, 3]]).is_diagonal()
+        assert not Matrix([[0, 0], [0, 3]]).is_diagonal()
+        assert not Matrix(2, 3).is_diagonal()
+
+    def test_is_upper_triangular(self):
+        assert Matrix([[1, 2], [0, 5]]).is_upper_triangular()
+        assert not Matrix([[1, 0], [4, 5]]).is_upper_triangular()
+        assert not Matrix([[1, 2, 3], [0, 5, 6]]).is_upper_triangular()
+        assert Matrix([[1, 2, 3], [0, 5, 6]]).is_upper_triangular(as_square=True)
+
+    def test_is_lower_triangular(self):
+        assert Matrix([[1, 0], [4, 5]]).is_lower_triangular()
+        assert not Matrix([[1, 2], [0, 5]]).is_lower_triangular()
+        assert not Matrix([[1, 0, 0], [4, 5, 0]]).is_lower_triangular()
+        assert Matrix([[7]]).is_lower_triangular()
+
+    def test_unit_matrix(self):
+        for n in (1, 2, 5):
+            unit = unit_matrix(n)
+            assert unit.size == (n, n) and unit.is_unit()
+            assert all(isinstance(elem, Element) for elem in unit)
+        with pytest.raises(TypeError):
+            unit_matrix(2.0)
+        with pytest.raises(InvalidDimension):
+            unit_matrix(0)
+
+    def test_is_unit(self):
+        assert unit_matrix(3).is_unit()
+        assert not Matrix([[1, 0], [0, 2]]).is_unit()
+        assert not Matrix([[1, 1], [0, 1]]).is_unit()
+        assert not Matrix([[1, 0, 0], [0, 1, 0]]).is_unit()
+
+    def test_is_conformable(self):
+        assert Matrix.is_conformable(Matrix(2, 3), Matrix(3, 4))
+        assert not Matrix.is_conformable(Matrix(2, 3), Matrix(2, 3))
+        for args in ((m, [[1]]), ([[1]], m)):
+            with pytest.raises(TypeError):
+                Matrix.is_conformable(*args)
+        with pytest.raises(InvalidDimension):
+            Matrix(2, 3) @ Matrix(2, 3)
+
+
+class TestOperations:
+    def test_matmul(self):
+        a = Matrix([[1, 2], [3, 4], [5, 6]])
+        b = Matrix([[1, 0.5, 0], [2, 1.5, -1]])
+        product = a @ b
+        assert product.size == (3, 3)
+        assert product._array == [[5, 3.5, -2], [11, 7.5, -4], [17, 11.5, -6]]
+        assert all(isinstance(elem, Element) for elem in product)
+        assert a @ unit_matrix(2) == a
+        # In-place, changing the number of columns
+        array = a._array
+        a @= b
+        assert a._array is array and a.size == (3, 3) and a == product
+        a |= unit_matrix(3)
+        assert a._array is array and a.size == (3, 6)
+
+    def test_scalar(self):
+        a = Matrix([[1, 2.5], [-3, 0.1]])
+        for result, array in (
+            (a * 2, [[2, 5], [-6, 0.2]]),
+            (0.5 * a, [[0.5, 1.25], [-1.5, 0.05]]),
+            (a / 4, [[0.25, 0.625], [-0.75, 0.025]]),
+            (-a, [[-1, -2.5], [3, -0.1]]),
+            # Floating-point error is rounded off
+            (Matrix([[1 / 3]]) * 3, [[1]]),
+            # Scalars near an integer are not rounded themselves
+            (Matrix([[1, 2]]) / 1e-13, [[10**13, 2 * 10**13]]),
+            (Matrix([[10**15]]) * 1e-13, [[100]]),
+            (Matrix([[10**6]]) * 1.0000000000001, [[1000000.0000001]]),
+        ):
+            assert result == Matrix(array)
+            assert all(isinstance(elem, Element) for elem in result)
+        for x in ("2", [2], 2j):
+            with pytest.raises(TypeError):
+                a * x
+            with pytest.raises(TypeError):
+                a / x
+
+    def test_add_sub(self):
+        a = Matrix([[1, 2.5], [-3, 0.1]])
+        b = Matrix([[2, 0.5], [3, 0.2]])
+        for result, array in (
+            (a + b, [[3, 3], [0, 0.3]]),
+            (a - b, [[-1, 2], [-6, -0.1]]),
+        ):
+            assert result == Matrix(array)
+            assert all(isinstance(elem, Element) for elem in result)
+        c = a
+        c += b
+        assert c is a and a == Matrix([[3, 3], [0, 0.3]])
+        for op in (operator.add, operator.sub):
+            with pytest.raises(InvalidDimension):
+                op(a, Matrix(2, 3))
+            with pytest.raises(TypeError):
+                op(a, 1)
+
+    def test_transposed(self):
+        a = Matrix([[1, 2, 3], [4, 5, 6]])
+        t = a.transposed()
+        assert t.size == (3, 2) and t._array == [[1, 4], [2, 5], [3, 6]]
+        assert a._array == [[1, 2, 3], [4, 5, 6]]
+        a.transpose()
+        assert a == t
+
+    def test_round(self):
+        m = Matrix([[1.25, 2.5], [-3.75, 4]])
+        m.round()
+        assert m._array == [[1, 2], [-4, 4]]
+        assert all(isinstance(elem, Element) for elem in m)
+
+    def test_pow(self):
+        a = Matrix([[1, 1], [1, 0]])
+        assert a**1 == a and a**1 is not a
+        product = a
+        for exp in range(2, 20):
+            product = product @ a
+            assert a**exp == product
+        # Fibonacci numbers
+        assert (a**100)[1, 2] == 354224848179261915075
+        assert a**-1 == ~a
+        for exp in (0, -2):
+            with pytest.raises(ValueError):
+                a**exp
+
+    def test_reductions(self):
+        a = Matrix([[2, 1, -1], [-3, -1, 2], [-2, 1, 2]])
+        assert a.determinant == -1
+        assert a @ ~a == unit_matrix(3)
+        assert a.rank == 3
+        assert Matrix([[1, 2], [2, 4]]).rank == 1
+        assert solve_linear_system(a, Matrix([[8], [-11], [-3]])) == (2, 3, -1)
+        with pytest.raises(ValueError):
+            ~Matrix([[1, 2], [2, 4]])
+        b = Matrix([[0.5, 1.5], [2, -1]])
+        assert Matrix.compare_rounded(b @ ~b, unit_matrix(2))
+        assert b.determinant == -3.5
+
+    def test_determinant(self):
+        def cofactor_det(array):
+            if len(array) == 1:
+                return array[0][0]
+            return sum(
+                (-1) ** j
+                * array[0][j]
+                * cofactor_det([row[:j] + row[j + 1 :] for row in array[1:]])
+                for j in range(len(array))
+            )
+
+        # Row interchanges negate the determinant
+        assert Matrix([[0, 1], [1, 0]]).determinant == -1
+        assert Matrix([[0, 1, 0], [0, 0, 1], [1, 0, 0]]).determinant == 1
+        assert Matrix([[0, 0], [1, 2]]).determinant == 0
+        for _ in range(50):
+            n = randint(1, 5)
+            array = [[randint(-3, 3) for _ in range(n)] for _ in range(n)]
+            assert Matrix(array).determinant == cofactor_det(array)
+
+    def test_row_echelon(self):
+        for _ in range(50):
+            m = randint_matrix(randint(1, 5), randint(1, 5), range(-2, 3))
+            m.to_row_echelon()
+            pivots = [row.pivot_index for row in m.rows]
+            nonzero = [p for p in pivots if p]
+            # Zero rows at the bottom and pivots strictly to the right
+            assert pivots[: len(nonzero)] == nonzero
+            assert all(p < q for p, q in zip(nonzero, nonzero[1:]))
+
+
+class TestRowsColumns:
+    def test_column(self):
+        m = Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+        col = m.columns[2]
+        assert list(col) == [2, 5, 8]
+        assert col[1:2] == [2, 5]
+        assert 5 in col and 4 not in col
+        assert str(col) == "Column([Element('2'), Element('5'), Element('8')])"
+        assert col + [1, 1, 1] == [3, 6, 9]
+        col[2:3] = [0, 0]
+        assert m._array == [[1, 2, 3], [4, 0, 6], [7, 0, 9]]
@@ -1,13 +1,16 @@
 #! /usr/bin/env pytest
 
+from itertools import tee
+
 import pytest
 
 from matrix.utils import *
 from matrix.components.elements import Element, to_Element
 
 
-def test_display_slice():
-    tests = (
+@pytest.mark.parametrize(
+    "args, string",
+    (
         ((None,), ":"),
         ((None, 2), ":2"),
         ((None, None, 2), "::2"),
@@ -15,24 +18,27 @@ def test_display_slice():
         ((2,), ":2"),
         ((2, 5), "2:5"),
         ((2, None, -1), "2::-1"),
-        ((None, 2, -1), ":2:-1"),
         ((1, 5, -1), "1:5:-1"),
-    )
-    for args, string in tests:
-        assert display_slice(slice(*args)) == string
+    ),
+)
+def test_display_slice(args, string):
+    assert display_slice(slice(*args)) == string
 
 
-def test_display_adj_slice():
-    tests = (
+@pytest.mark.parametrize(
+    "args, string",
+    (
         ((0, 4, 1), "1:4"),
         ((2, 4, 2), "3:4:2"),
-    )
-    for args, string in tests:
-        assert display_adj_slice(slice(*args)) == string
+    ),
+)
+def test_display_adj_slice(args, string):
+    assert display_adj_slice(slice(*args)) == string
 
 
-def test_adjust_slice():
-    tests = (
+@pytest.mark.parametrize(
+    "s1, s2",
+    (
         # Whole slice
         (slice(5), slice(0, 5, 1)),
         (slice(1, 5), slice(0, 5, 1)),
@@ -50,28 +56,43 @@ def test_adjust_slice():
         (slice(3, 4), slice(2, 4, 1)),
         (slice(3, 6), slice(2, 5, 1)),
         (slice(100), slice(0, 5, 1)),
-    )
-    for s1, s2 in tests:
-        adjust_slice(s1, 5) == s2
-
-    tests = slice
-    for s in (slice(0, None), slice(0), slice(None, None, 0), slice(-10)):
-        with pytest.raises(ValueError, match=".* less than 1."):
-            adjust_slice(s, 5)
-    with pytest.raises(ValueError, match=".* 'start' of slice."):
-        adjust_slice(slice(6, None), 5)
-    with pytest.raises(ValueError, match="'start' > 'stop' .*"):
-        adjust_slice(slice(6, 4), 5)
-
-
-def test_slice_length():
-    assert slice_length(slice(0, 4, 1)) == 4
-    assert slice_length(slice(1, 4, 2)) == 2
-    assert slice_length(slice(5, 6, 7)) == 1
-
-
-def test_slice_index():
-    tests = (
+    ),
+)
+def test_adjust_slice(s1, s2):
+    assert adjust_slice(s1, 5) == s2
+
+
+@pytest.mark.parametrize(
+    "s, match",
+    (
+        (slice(0, None), ".* less than 1."),
+        (slice(0), ".* less than 1."),
+        (slice(None, None, 0), ".* less than 1."),
+        (slice(-10), ".* less than 1."),
+        (slice(6, None), ".* 'start' of slice."),
+        (slice(6, 4), "'start' > 'stop' .*"),
+    ),
+)
+def test_adjust_slice_errors(s, match):
+    with pytest.raises(ValueError, match=match):
+        adjust_slice(s, 5)
+
+
+@pytest.mark.parametrize(
+    "s, length",
+    (
+        (slice(0, 4, 1), 4),
+        (slice(1, 4, 2), 2),
+        (slice(5, 6, 7), 1),
+    ),
+)
+def test_slice_length(s, length):
+    assert slice_length(s) == length
+
+
+@pytest.mark.parametrize(
+    "args, index, result",
+    (
         ((0, 4, 1), 0, 0),
         ((0, 4, 1), 1, 1),
         ((0, 4, 2), 0, 0),
@@ -80,67 +101,92 @@ def test_slice_index():
         ((1, 4, 1), 1, 2),
         ((1, 4, 2), 0, 1),
         ((1, 4, 2), 1, 3),
-    )
-    for args, index, result in tests:
-        assert slice_index(slice(*args), index) == result
+    ),
+)
+def test_slice_index(args, index, result):
+    assert slice_index(slice(*args), index) == result
 
 
 def test_original_slice():
-    # Theoretically, if `slice_index()` works properly, this also works properly.
-    pass
+    seq = list(range(20))
+    for s1, s2 in (
+        (slice(0, 20, 1), slice(2, 5, 1)),
+        (slice(3, 15, 1), slice(0, 4, 1)),
+        (slice(1, 20, 2), slice(1, 6, 1)),
+        (slice(2, 18, 3), slice(0, 5, 2)),
+        (slice(0, 20, 1), slice(1, 19, 4)),
+    ):
+        assert seq[original_slice(s1, s2)] == seq[s1][s2]
+
+
+@pytest.mark.parametrize("obj", ([], (), "", {}, b"", set()))
+def test_is_iterable(obj):
+    assert is_iterable(obj)
+
+
+# A generator can't be shared across parametrized runs
+def test_is_iterable_generator():
+    assert is_iterable(x for x in "x")
 
 
-def test_is_iterable():
-    for obj in ([], (), "", {}, (x for x in "x"), b"", set()):
-        assert is_iterable(obj)
-    for obj in (2, 2.0, 2j):
-        assert not is_iterable(obj)
+@pytest.mark.parametrize("obj", (2, 2.0, 2j))
+def test_is_not_iterable(obj):
+    assert not is_iterable(obj)
 
 
 def test_valid_container():
-    it = range(5)
-    for iterable in (it, list(it), tuple(it), (x for x in it)):
+    # `tee()` pairs the generator with an independent copy to check against
+    reference = list(range(5))
+    for iterable, check in (
+        (range(5), reference),
+        (reference, reference),
+        (tuple(reference), reference),
+        tee(x for x in reference),
+    ):
         it_ = valid_container(iterable)
-        assert len(it) == len(it_)
-        assert all(isinstance(x, Element) for x in it_)
-        assert all(to_Element(x) == y for x, y in zip(it, it_))
+        assert len(reference) == len(it_)
+        for x, y in zip(check, it_):
+            assert isinstance(y, Element) and to_Element(x) == y
     it = (5, 7.9, Element(6.9))
-    for iterable in (it, list(it), (x for x in it)):
+    for iterable, check in ((it, it), (list(it), it), tee(x for x in it)):
         it_ = valid_container(iterable)
-        print(it, it_)
         assert len(it) == len(it_)
-        assert all(isinstance(x, Element) for x in it_)
-        # Excludes the gen_exp
-        assert all(to_Element(x) == y for x, y in zip(it, it_))
+        for x, y in zip(check, it_):
+            assert isinstance(y, Element) and to_Element(x) == y
     assert valid_container(range(2), 2)
     # Errors
     for x in (2, ["2"]):
         with pytest.raises(TypeError):
             valid_container(x)
-    with pytest.raises(ValueError):
-        valid_container([2, 3], 3)
+    for iterable in ([2, 3], (x for x in (2, 3))):
+        with pytest.raises(ValueError):
+            valid_container(iterable, 3)
+    # Element types are checked before the length, whatever the container
+    for iterable in (["2", "3"], "23", (x for x in "23")):
+        with pytest.raises(TypeError):
+            valid_container(iterable, 3)
 
 
 def test_valid_2D_iterable():
+    gen, check = tee(x for x in range(10))
     it = [
         (5, 7.9, Element(6.9)),
         range(5),
         [],
-        (x for x in range(10)),
+        gen,
     ]
     result = valid_2D_iterable(it)
+    it[3] = check
 
     assert len(result) == 4
     assert result[0] == 0
     assert result[1] == 10
     assert result[2] == 4
     assert isinstance(result[3], list)
-    assert all(isinstance(row, list) for row in result[3])
-    assert all(
-        # Excludes the gen_exp
-        all(to_Element(x) == y for x, y in zip(r1, r2))
-        for r1, r2 in zip(it, result[3])
-    )
+    for r1, r2 in zip(it, result[3]):
+        assert isinstance(r2, list)
+        for x, y in zip(r1, r2):
+            assert isinstance(y, Element) and to_Element(x) == y
     # Errors
     for arg in (12, [[2], 2]):
         with pytest.raises(TypeError, match=".* iterable of iterables."):
@@ -162,10 +208,15 @@ class A:
         self.__a_self = "A().a"
 
 
+# The instances are only read from, hence are shared across the module.
+@pytest.fixture(scope="module")
+def a():
+    return A()
+
+
 @A._register
 class TestA:
-    def test(self):
-        a = A()
+    def test(self, a):
         assert a.__a_class == "A.a"
         assert a.__a_self == "A().a"
         # Cannot be referenced via the class
@@ -181,10 +232,14 @@ class B(A):
         self.__b_self = "B().b"
 
 
+@pytest.fixture(scope="module")
+def b():
+    return B()
+
+
 @B._register  # Is actually registered to A
 class TestB:
-    def test(self):
-        b = B()
+    def test(self, b):
         assert b.__a_class == "A.a"
         assert b.__a_self == "A().a"
         # B was not decorated with `mangle_attr()`
@@ -203,12 +258,16 @@ class C(B):
         self.__c_self = "C().c"
 
 
+@pytest.fixture(scope="module")
+def c():
+    return C()
+
+
 # Multi-level decoration
 @C._register
 @B._register  # Is actually registered to A
 class TestC:
-    def test(self):
-        c = C()
+    def test(self, c):
         assert c.__a_class == "A.a"
         assert c.__a_self == "A().a"
         assert c.__c_class == "C.c"
@@ -217,3 +276,70 @@ class TestC:
             c.__b_class
         with pytest.raises(AttributeError):
             c.__b_self
+
+
+@mangled_attr()
+class _D:
+    def __init__(self):
+        self.__d_self = "_D().d"
+
+
+# Leading underscores are stripped from the class name in mangled names
+@_D._register
+class TestD:
+    def test(self):
+        d = _D()
+        assert d.__d_self == "_D().d"
+        d.__d_self = "new"
+        assert d.__d_self == "new"
+
+
+class _E:
+    def __getattr__(self, name):
+        # Fails for another attribute, as e.g a property body could.
+        return object.__getattribute__(self, "_inner")
+
+
+@mangled_attr()
+class F(_E):
+    pass
+
+
+@mangled_attr()
+class G:
+    @property
+    def prop(self):
+        return self.missing_inner
+
+
+@mangled_attr()
+class H(G):
+    pass
+
+
+def test_mangled_attr_errors(a):
+    with pytest.raises(AttributeError) as info:
+        a.missing
+    assert info.value.name == "missing" and info.value.obj is a
+    # Errors not about the attribute itself are not swallowed
+    with pytest.raises(AttributeError, match="'_inner'"):
+        F().missing
+    # The original error from within a property body is raised
+    for obj in (G(), H()):
+        with pytest.raises(AttributeError, match="'missing_inner'"):
+            obj.prop
+
+
+def test_to_Element():
+    for value, result in (
+        (2, "2"),
+        (2.0, "2"),
+        (2.5, "2.5"),
+        (0.1, "0.1"),
+        (10**30, str(10**30)),
+        (Element("2.0000000000000001"), "2"),
+        (True, "1"),
+    ):
+        elem = to_Element(value)
+        assert isinstance(elem, Element)
+        assert str(elem) == result